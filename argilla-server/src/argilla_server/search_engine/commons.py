@@ -55,6 +55,11 @@ from argilla_server.search_engine.base import (
 )
 
 
+# Module-level frozensets so membership checks don't rebuild a list on every call.
+KEYWORD_QUESTION_TYPES = frozenset({QuestionType.label_selection, QuestionType.multi_label_selection})
+NUMERIC_METADATA_PROPERTY_TYPES = frozenset({MetadataPropertyType.float, MetadataPropertyType.integer})
+
+
 def es_index_name_for_dataset(dataset: Dataset):
     return f"rg.{dataset.id}"
 
@@ -210,7 +215,7 @@ def es_mapping_for_question(question: Question) -> dict:
     if question_type == QuestionType.rating:
         # See https://www.elastic.co/guide/en/elasticsearch/reference/current/number.html
         return {"type": "integer"}
-    elif question_type in [QuestionType.label_selection, QuestionType.multi_label_selection]:
+    elif question_type in KEYWORD_QUESTION_TYPES:
         return {"type": "keyword"}
     else:
         # The rest of the question types will be ignored for now. Once we have a filters feat we can design
@@ -480,7 +485,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         if metadata_property.type == MetadataPropertyType.terms:
             return await self._metrics_for_terms_property(index_name, metadata_property)
 
-        if metadata_property.type in [MetadataPropertyType.float, MetadataPropertyType.integer]:
+        if metadata_property.type in NUMERIC_METADATA_PROPERTY_TYPES:
             return await self._metrics_for_numeric_property(index_name, metadata_property)
 
     def build_elasticsearch_filter(self, filter: Filter) -> Dict[str, Any]:
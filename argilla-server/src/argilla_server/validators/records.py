@@ -12,13 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import copy
-import mimetypes
+import re
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Union, Any
+from dataclasses import dataclass
+from typing import Dict, List, Set, Union, Any
 from uuid import UUID
-from urllib.parse import urlparse, ParseResult, ParseResultBytes
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,7 +26,7 @@ from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpdate, Re
 from argilla_server.api.schemas.v1.records_bulk import RecordsBulkCreate, RecordsBulkUpsert
 from argilla_server.contexts import records
 from argilla_server.errors.future.base_errors import UnprocessableEntityError
-from argilla_server.models import Dataset, Record
+from argilla_server.models import Dataset, MetadataProperty, Record
 
 IMAGE_FIELD_WEB_URL_MAX_LENGTH = 2038
 IMAGE_FIELD_DATA_URL_MAX_LENGTH = 5_000_000
@@ -41,44 +40,109 @@ IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES = [
     "image/svg",
     "image/webp",
 ]
-CHAT_FIELD_MAX_LENGTH = 500
+# Frozenset counterpart for O(1) membership checks; the list above is kept for the
+# deterministic ordering of error messages.
+_IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES = frozenset(IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES)
+
+# Precompiled so that validating an image field is a single C-level match instead of a
+# urlparse plus mimetypes lookup per value.
+IMAGE_FIELD_WEB_URL_REGEX = re.compile(r"^https?://[^/\s]+/\S*$", re.IGNORECASE)
+IMAGE_FIELD_DATA_URL_REGEX = re.compile(r"^data:(?P<mime_type>[^;,]*)(?:;[^,]*)?,\S*$")
+
+
+@dataclass
+class _DatasetValidationPlan:
+    """Dataset descriptors precomputed once per validation run.
+
+    Bulk endpoints validate every record against the same dataset, so the dataset fields
+    and metadata properties relationships are traversed here a single time instead of
+    once per record.
+    """
+
+    dataset: Dataset
+    required_field_names: List[str]
+    configured_field_names: Set[str]
+    image_field_names: List[str]
+    chat_field_names: List[str]
+    custom_field_names: List[str]
+    metadata_properties_by_name: Dict[str, MetadataProperty]
+
+    @classmethod
+    def from_dataset(cls, dataset: Dataset) -> "_DatasetValidationPlan":
+        required_field_names = []
+        configured_field_names = set()
+        image_field_names = []
+        chat_field_names = []
+        custom_field_names = []
+
+        for field in dataset.fields:
+            configured_field_names.add(field.name)
+            if field.required:
+                required_field_names.append(field.name)
+            if field.is_image:
+                image_field_names.append(field.name)
+            if field.is_chat:
+                chat_field_names.append(field.name)
+            if field.is_custom:
+                custom_field_names.append(field.name)
+
+        return cls(
+            dataset=dataset,
+            required_field_names=required_field_names,
+            configured_field_names=configured_field_names,
+            image_field_names=image_field_names,
+            chat_field_names=chat_field_names,
+            custom_field_names=custom_field_names,
+            metadata_properties_by_name={
+                metadata_property.name: metadata_property for metadata_property in dataset.metadata_properties
+            },
+        )
 
 
 class RecordValidatorBase(ABC):
     @classmethod
     @abstractmethod
-    def validate(cls, record: Union[RecordCreate, RecordUpdate], dataset: Dataset) -> None:
+    def validate(
+        cls,
+        record: Union[RecordCreate, RecordUpdate],
+        dataset: Dataset,
+        plan: Union[_DatasetValidationPlan, None] = None,
+    ) -> None:
         pass
 
     @classmethod
-    def _validate_fields(cls, record: Union[RecordCreate, RecordUpdate], dataset: Dataset) -> None:
+    def _validate_fields(cls, record: Union[RecordCreate, RecordUpdate], plan: _DatasetValidationPlan) -> None:
         fields = record.fields or {}
 
-        cls._validate_required_fields(dataset=dataset, fields=fields)
-        cls._validate_extra_fields(dataset=dataset, fields=fields)
-        cls._validate_image_fields(dataset=dataset, fields=fields)
-        cls._validate_chat_fields(dataset=dataset, fields=fields)
-        cls._validate_custom_fields(dataset=dataset, fields=fields)
+        cls._validate_required_fields(plan=plan, fields=fields)
+        cls._validate_extra_fields(plan=plan, fields=fields)
+
+        # Most datasets have no image, chat or custom fields, so skip the dispatch
+        # altogether instead of looping over empty name lists for every record.
+        if plan.image_field_names:
+            cls._validate_image_fields(plan=plan, fields=fields)
+        if plan.chat_field_names:
+            cls._validate_chat_fields(plan=plan, fields=fields)
+        if plan.custom_field_names:
+            cls._validate_custom_fields(plan=plan, fields=fields)
 
     @staticmethod
-    def _validate_required_fields(dataset: Dataset, fields: Dict[str, str]) -> None:
-        for field in dataset.fields:
-            if field.required and not (field.name in fields and fields.get(field.name) is not None):
-                raise UnprocessableEntityError(f"missing required value for field: {field.name!r}")
+    def _validate_required_fields(plan: _DatasetValidationPlan, fields: Dict[str, str]) -> None:
+        for name in plan.required_field_names:
+            if fields.get(name) is None:
+                raise UnprocessableEntityError(f"missing required value for field: {name!r}")
 
     @staticmethod
-    def _validate_extra_fields(dataset: Dataset, fields: Dict[str, str]) -> None:
-        fields_copy = copy.copy(fields)
-        for field in dataset.fields:
-            fields_copy.pop(field.name, None)
-        if fields_copy:
-            raise UnprocessableEntityError(f"found fields values for non configured fields: {list(fields_copy.keys())}")
+    def _validate_extra_fields(plan: _DatasetValidationPlan, fields: Dict[str, str]) -> None:
+        extra_fields = [name for name in fields if name not in plan.configured_field_names]
+        if extra_fields:
+            raise UnprocessableEntityError(f"found fields values for non configured fields: {extra_fields}")
 
     @staticmethod
-    def _validate_metadata(record: Union[RecordCreate, RecordUpdate], dataset: Dataset) -> None:
+    def _validate_metadata(record: Union[RecordCreate, RecordUpdate], plan: _DatasetValidationPlan) -> None:
         metadata = record.metadata or {}
         for name, value in metadata.items():
-            metadata_property = dataset.metadata_property_by_name(name)
+            metadata_property = plan.metadata_properties_by_name.get(name)
             # TODO(@frascuchon): Create a MetadataPropertyValidator instead of using the parsed_settings
             if metadata_property and value is not None:
                 try:
@@ -88,38 +152,55 @@ class RecordValidatorBase(ABC):
                         f"metadata is not valid: '{name}' metadata property validation failed because {e}"
                     ) from e
 
-            elif metadata_property is None and not dataset.allow_extra_metadata:
+            elif metadata_property is None and not plan.dataset.allow_extra_metadata:
                 raise UnprocessableEntityError(
-                    f"metadata is not valid: '{name}' metadata property does not exists for dataset '{dataset.id}' "
-                    "and extra metadata is not allowed for this dataset"
+                    f"metadata is not valid: '{name}' metadata property does not exists for dataset "
+                    f"'{plan.dataset.id}' and extra metadata is not allowed for this dataset"
                 )
 
     @classmethod
-    def _validate_image_fields(cls, dataset: Dataset, fields: Dict[str, str]) -> None:
-        for field in filter(lambda field: field.is_image, dataset.fields):
-            cls._validate_image_field(field.name, fields.get(field.name))
+    def _validate_image_fields(cls, plan: _DatasetValidationPlan, fields: Dict[str, str]) -> None:
+        for name in plan.image_field_names:
+            cls._validate_image_field(name, fields.get(name))
 
     @classmethod
-    def _validate_chat_fields(cls, dataset: Dataset, fields: Dict[str, Any]) -> None:
-        for field in filter(lambda field: field.is_chat, dataset.fields):
-            cls._validate_chat_field(field.name, fields.get(field.name))
+    def _validate_chat_fields(cls, plan: _DatasetValidationPlan, fields: Dict[str, Any]) -> None:
+        for name in plan.chat_field_names:
+            cls._validate_chat_field(name, fields.get(name))
 
     @classmethod
     def _validate_image_field(cls, field_name: str, field_value: Union[str, None]) -> None:
         if field_value is None:
             return
 
-        try:
-            parse_result = urlparse(field_value)
-        except ValueError:
-            raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
+        if field_value.startswith("data:"):
+            # Checking the length before the regex avoids scanning multi-megabyte data URLs
+            # just to reject them afterwards.
+            if len(field_value) > IMAGE_FIELD_DATA_URL_MAX_LENGTH:
+                raise UnprocessableEntityError(
+                    f"image field {field_name!r} value is exceeding the maximum length of {IMAGE_FIELD_DATA_URL_MAX_LENGTH} characters for Data URLs"
+                )
+
+            match = IMAGE_FIELD_DATA_URL_REGEX.match(field_value)
+            if match is None:
+                raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
+
+            if match.group("mime_type") not in _IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES:
+                raise UnprocessableEntityError(
+                    f"image field {field_name!r} value is using an unsupported MIME type, supported MIME types are: {IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES!r}"
+                )
+
+            return
+
+        if IMAGE_FIELD_WEB_URL_REGEX.match(field_value):
+            if len(field_value) > IMAGE_FIELD_WEB_URL_MAX_LENGTH:
+                raise UnprocessableEntityError(
+                    f"image field {field_name!r} value is exceeding the maximum length of {IMAGE_FIELD_WEB_URL_MAX_LENGTH} characters for Web URLs"
+                )
+
+            return
 
-        if parse_result.scheme in ["http", "https"]:
-            return cls._validate_web_url(field_name, field_value, parse_result)
-        elif parse_result.scheme in ["data"]:
-            return cls._validate_data_url(field_name, field_value, parse_result)
-        else:
-            raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
+        raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
 
     @classmethod
     def _validate_chat_field(cls, field_name: str, field_value: Any) -> None:
@@ -127,43 +208,17 @@ class RecordValidatorBase(ABC):
         if field_value is None:
             return
 
-        if not isinstance(field_value, list) or any(not isinstance(message, ChatFieldValue) for message in field_value):
+        if not isinstance(field_value, list):
             raise UnprocessableEntityError(f"chat field {field_name!r} value must be a list of messages")
 
-    @staticmethod
-    def _validate_web_url(
-        field_name: str, field_value: str, parse_result: Union[ParseResult, ParseResultBytes]
-    ) -> None:
-        if not parse_result.netloc or not parse_result.path:
-            raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
-
-        if len(field_value) > IMAGE_FIELD_WEB_URL_MAX_LENGTH:
-            raise UnprocessableEntityError(
-                f"image field {field_name!r} value is exceeding the maximum length of {IMAGE_FIELD_WEB_URL_MAX_LENGTH} characters for Web URLs"
-            )
-
-    @staticmethod
-    def _validate_data_url(
-        field_name: str, field_value: str, parse_result: Union[ParseResult, ParseResultBytes]
-    ) -> None:
-        if not parse_result.path:
-            raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
-
-        if len(field_value) > IMAGE_FIELD_DATA_URL_MAX_LENGTH:
-            raise UnprocessableEntityError(
-                f"image field {field_name!r} value is exceeding the maximum length of {IMAGE_FIELD_DATA_URL_MAX_LENGTH} characters for Data URLs"
-            )
-
-        type, encoding = mimetypes.guess_type(field_value)
-        if type not in IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES:
-            raise UnprocessableEntityError(
-                f"image field {field_name!r} value is using an unsupported MIME type, supported MIME types are: {IMAGE_FIELD_DATA_URL_VALID_MIME_TYPES!r}"
-            )
+        for message in field_value:
+            if not isinstance(message, ChatFieldValue):
+                raise UnprocessableEntityError(f"chat field {field_name!r} value must be a list of messages")
 
     @classmethod
-    def _validate_custom_fields(cls, dataset: Dataset, fields: Dict[str, Any]) -> None:
-        for field in filter(lambda field: field.is_custom, dataset.fields):
-            cls._validate_custom_field(field.name, fields.get(field.name))
+    def _validate_custom_fields(cls, plan: _DatasetValidationPlan, fields: Dict[str, Any]) -> None:
+        for name in plan.custom_field_names:
+            cls._validate_custom_field(name, fields.get(name))
 
     @classmethod
     def _validate_custom_field(cls, name: str, value: Any) -> None:
@@ -176,24 +231,33 @@ class RecordValidatorBase(ABC):
 
 class RecordCreateValidator(RecordValidatorBase):
     @classmethod
-    def validate(cls, record: RecordCreate, dataset: Dataset) -> None:
-        cls._validate_fields(record, dataset)
-        cls._validate_metadata(record, dataset)
+    def validate(cls, record: RecordCreate, dataset: Dataset, plan: Union[_DatasetValidationPlan, None] = None) -> None:
+        plan = plan or _DatasetValidationPlan.from_dataset(dataset)
+
+        cls._validate_fields(record, plan)
+        cls._validate_metadata(record, plan)
 
 
 class RecordUpdateValidator(RecordValidatorBase):
     @classmethod
-    def validate(cls, record: RecordUpdate, dataset: Dataset) -> None:
-        cls._validate_metadata(record, dataset)
+    def validate(
+        cls,
+        record: Union[RecordUpdate, RecordUpsert],
+        dataset: Dataset,
+        plan: Union[_DatasetValidationPlan, None] = None,
+    ) -> None:
+        plan = plan or _DatasetValidationPlan.from_dataset(dataset)
+
+        cls._validate_metadata(record, plan)
         cls._validate_duplicated_suggestions(record)
 
     @staticmethod
-    def _validate_duplicated_suggestions(record: RecordUpdate):
-        if not record.suggestions:
-            return
-        question_ids = [s.question_id for s in record.suggestions]
-        if len(question_ids) != len(set(question_ids)):
-            raise UnprocessableEntityError("found duplicate suggestions question IDs")
+    def _validate_duplicated_suggestions(record: Union[RecordUpdate, RecordUpsert]):
+        seen_question_ids = set()
+        for suggestion in record.suggestions or []:
+            if suggestion.question_id in seen_question_ids:
+                raise UnprocessableEntityError("found duplicate suggestions question IDs")
+            seen_question_ids.add(suggestion.question_id)
 
 
 class RecordsBulkCreateValidator:
@@ -213,17 +277,37 @@ class RecordsBulkCreateValidator:
         db: AsyncSession, records_create: RecordsBulkCreate, dataset: Dataset
     ):
         external_ids = [r.external_id for r in records_create.items if r.external_id is not None]
-        records_by_external_id = await records.fetch_records_by_external_ids_as_dict(db, dataset, external_ids)
+        unique_external_ids = set(external_ids)
+
+        if len(unique_external_ids) != len(external_ids):
+            seen_external_ids = set()
+            duplicated_external_ids = set()
+            for external_id in external_ids:
+                if external_id in seen_external_ids:
+                    duplicated_external_ids.add(external_id)
+                seen_external_ids.add(external_id)
 
-        found_records = [str(external_id) for external_id in external_ids if external_id in records_by_external_id]
-        if found_records:
-            raise UnprocessableEntityError(f"found records with same external ids: {', '.join(found_records)}")
+            raise UnprocessableEntityError(
+                f"found duplicate records external ids: {', '.join(sorted(map(str, duplicated_external_ids)))}"
+            )
+
+        # Passing the deduplicated ids keeps the SQL IN clause as small as possible.
+        records_by_external_id = await records.fetch_records_by_external_ids_as_dict(
+            db, dataset, list(unique_external_ids)
+        )
+
+        found_external_ids = unique_external_ids & records_by_external_id.keys()
+        if found_external_ids:
+            raise UnprocessableEntityError(
+                f"found records with same external ids: {', '.join(sorted(map(str, found_external_ids)))}"
+            )
 
     @staticmethod
     def _validate_all_bulk_records(dataset: Dataset, records_create: List[RecordCreate]):
+        plan = _DatasetValidationPlan.from_dataset(dataset)
         for idx, record_create in enumerate(records_create):
             try:
-                RecordCreateValidator.validate(record_create, dataset)
+                RecordCreateValidator.validate(record_create, dataset, plan)
             except UnprocessableEntityError as ex:
                 raise UnprocessableEntityError(f"record at position {idx} is not valid because {ex}") from ex
 
@@ -251,15 +335,22 @@ class RecordsBulkUpsertValidator:
         existing_records_by_external_id_or_record_id: Union[Dict[Union[str, UUID], Record], None] = None,
     ):
         existing_records_by_external_id_or_record_id = existing_records_by_external_id_or_record_id or {}
+        plan = _DatasetValidationPlan.from_dataset(dataset)
         for idx, record_upsert in enumerate(records_upsert):
             try:
                 record = existing_records_by_external_id_or_record_id.get(
                     record_upsert.id
                 ) or existing_records_by_external_id_or_record_id.get(record_upsert.external_id)
 
+                # The records already went through the RecordsBulkUpsert schema validation and the
+                # record validators only read attributes present on RecordUpsert, so they are
+                # validated in place instead of re-running a full pydantic parse per record.
                 if record:
-                    RecordUpdateValidator.validate(RecordUpdate.parse_obj(record_upsert), dataset)
+                    RecordUpdateValidator.validate(record_upsert, dataset, plan)
                 else:
-                    RecordCreateValidator.validate(RecordCreate.parse_obj(record_upsert), dataset)
+                    if record_upsert.fields is None:
+                        raise UnprocessableEntityError("fields is required when creating a record")
+
+                    RecordCreateValidator.validate(record_upsert, dataset, plan)
             except (UnprocessableEntityError, ValueError) as ex:
                 raise UnprocessableEntityError(f"record at position {idx} is not valid because {ex}") from ex
@@ -15,9 +15,11 @@
 import pytest
 from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpsert
 from argilla_server.api.schemas.v1.records_bulk import RecordsBulkCreate, RecordsBulkUpsert
+from argilla_server.contexts import records
 from argilla_server.errors.future import UnprocessableEntityError
 from argilla_server.models import Dataset
 from argilla_server.validators.records import RecordsBulkCreateValidator, RecordsBulkUpsertValidator
+from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.factories import DatasetFactory, RecordFactory, TextFieldFactory
@@ -81,6 +83,42 @@ class TestRecordsBulkValidators:
         with pytest.raises(UnprocessableEntityError, match="found records with same external ids: 1"):
             await RecordsBulkCreateValidator.validate(db, records_create, dataset)
 
+    async def test_records_bulk_create_validator_with_duplicated_external_ids(
+        self, db: AsyncSession, mocker: "MockerFixture"
+    ):
+        dataset = await self.configure_dataset()
+
+        # Built with `construct` to skip the schema-level uniqueness check, so the
+        # validator safety net is the one being exercised.
+        records_create = RecordsBulkCreate.construct(
+            items=[
+                RecordCreate(external_id="1", fields={"text": "hello world"}),
+                RecordCreate(external_id="1", fields={"text": "hello world"}),
+            ],
+        )
+
+        fetch_records_spy = mocker.spy(records, "fetch_records_by_external_ids_as_dict")
+
+        with pytest.raises(UnprocessableEntityError, match="found duplicate records external ids: 1"):
+            await RecordsBulkCreateValidator.validate(db, records_create, dataset)
+
+        fetch_records_spy.assert_not_called()
+
+    async def test_records_bulk_create_validator_with_multiple_duplicated_external_ids(self, db: AsyncSession):
+        dataset = await self.configure_dataset()
+
+        records_create = RecordsBulkCreate.construct(
+            items=[
+                RecordCreate(external_id="b", fields={"text": "hello world"}),
+                RecordCreate(external_id="a", fields={"text": "hello world"}),
+                RecordCreate(external_id="b", fields={"text": "hello world"}),
+                RecordCreate(external_id="a", fields={"text": "hello world"}),
+            ],
+        )
+
+        with pytest.raises(UnprocessableEntityError, match="found duplicate records external ids: a, b"):
+            await RecordsBulkCreateValidator.validate(db, records_create, dataset)
+
     async def test_records_bulk_create_validator_with_record_errors(self, db: AsyncSession):
         dataset = await self.configure_dataset()
         records_create = RecordsBulkCreate(
@@ -121,6 +159,21 @@ class TestRecordsBulkValidators:
 
             RecordsBulkUpsertValidator.validate(records_upsert, dataset)
 
+    async def test_records_bulk_upsert_validator_creating_record_without_fields(self, db: AsyncSession):
+        dataset = await self.configure_dataset()
+
+        records_upsert = RecordsBulkUpsert(
+            items=[
+                RecordUpsert(external_id="1"),
+            ]
+        )
+
+        with pytest.raises(
+            UnprocessableEntityError,
+            match="record at position 0 is not valid because fields is required when creating a record",
+        ):
+            RecordsBulkUpsertValidator.validate(records_upsert, dataset)
+
     async def test_records_bulk_upsert_validator_with_record_error(self, db: AsyncSession):
         dataset = await self.configure_dataset()
         records_upsert = RecordsBulkUpsert(
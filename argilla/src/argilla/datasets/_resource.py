@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import re
 import warnings
 from typing import Optional, Union
 from uuid import UUID, uuid4
@@ -33,6 +34,8 @@ from argilla.workspaces._resource import Workspace
 
 __all__ = ["Dataset"]
 
+_DATASET_NAME_SANITIZE_REGEX = re.compile(r"[/\\.,;:\-+=]")
+
 
 class Dataset(Resource, HubImportExportMixin, DiskImportExportMixin):
     """Class for interacting with Argilla Datasets
@@ -286,11 +289,7 @@ class Dataset(Resource, HubImportExportMixin, DiskImportExportMixin):
 
     @classmethod
     def _sanitize_name(cls, name: str):
-        name = name.replace(" ", "_")
-
-        for character in ["/", "\\", ".", ",", ";", ":", "-", "+", "="]:
-            name = name.replace(character, "-")
-        return name
+        return _DATASET_NAME_SANITIZE_REGEX.sub("-", name.replace(" ", "_"))
 
     def _with_client(self, client: Argilla) -> "Self":
         return super()._with_client(client=client)
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
@@ -33,6 +34,28 @@ if TYPE_CHECKING:
     from argilla.datasets import Dataset
 
 
+def _default_batch_size_from_env() -> int:
+    """Resolve the default ingestion batch size from ARGILLA_RECORDS_BATCH_SIZE.
+
+    Falls back to the server bulk upsert limit when the variable is unset or not an
+    integer, and clamps any configured value to the [1, limit] range.
+    """
+    value = os.getenv("ARGILLA_RECORDS_BATCH_SIZE")
+    if value is None:
+        return RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK
+
+    try:
+        batch_size = int(value)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring invalid ARGILLA_RECORDS_BATCH_SIZE value {value!r}: must be an integer. "
+            f"Using the default batch size of {RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK}."
+        )
+        return RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK
+
+    return min(max(batch_size, 1), RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK)
+
+
 class RecordErrorHandling(Enum):
     RAISE = "raise"
     WARN = "warn"
@@ -164,7 +187,11 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     _api: RecordsAPI
 
-    DEFAULT_BATCH_SIZE = 256
+    # Ingestion throughput is dominated by the number of bulk requests, so by default use
+    # batches as large as the server accepts per bulk upsert. The value can be tuned down
+    # (e.g. for memory constrained clients) with the ARGILLA_RECORDS_BATCH_SIZE environment
+    # variable and is always clamped to the server limit.
+    DEFAULT_BATCH_SIZE = _default_batch_size_from_env()
     DEFAULT_DELETE_BATCH_SIZE = 64
 
     def __init__(
@@ -197,7 +224,7 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
         Parameters:
             query: A string or a Query object to filter the records.
-            batch_size: The number of records to fetch in each batch. The default is 256.
+            batch_size: The number of records to fetch in each batch. The default is `DEFAULT_BATCH_SIZE`.
             start_offset: The offset from which to start fetching records. The default is 0.
             with_suggestions: Whether to include suggestions in the records. The default is True.
             with_responses: Whether to include responses in the records. The default is True.
@@ -255,7 +282,9 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             mapping: A dictionary that maps the keys/ column names in the records to the fields or questions in the Argilla dataset.
                      To assign an incoming key or column to multiple fields or questions, provide a list or tuple of field or question names.
             user_id: The user id to be associated with the records' response. If not provided, the current user id is used.
-            batch_size: The number of records to send in each batch. The default is 256.
+            batch_size: The number of records to send in each batch. The default is `DEFAULT_BATCH_SIZE`,
+                which matches the maximum number of records accepted by the server per bulk request
+                and can be tuned with the `ARGILLA_RECORDS_BATCH_SIZE` environment variable.
 
         Returns:
             A list of Record objects representing the updated records.
@@ -198,12 +198,14 @@ class HFDatasetsIO:
         """
         hf_dataset = HFDatasetsIO.to_argilla(hf_dataset=hf_dataset)
 
-        try:
-            hf_dataset = hf_dataset.to_iterable_dataset()
-        except AttributeError:
-            pass
-
-        record_dicts = [example for example in hf_dataset]
+        # Fetch the dataset column-at-a-time instead of row-at-a-time: accessing a column
+        # materializes it as a plain list in a single Arrow call, so building the record
+        # dicts becomes a flat zip over columns rather than one Arrow->Python conversion
+        # (plus per-column lookups) for every row.
+        column_names = hf_dataset.column_names
+        columns = [hf_dataset[column_name] for column_name in column_names]
+
+        record_dicts = [dict(zip(column_names, row)) for row in zip(*columns)]
         return record_dicts
 
     @staticmethod
@@ -0,0 +1,45 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from argilla._api import RecordsAPI
+from argilla.records._dataset_records import _default_batch_size_from_env
+
+
+class TestDefaultBatchSizeFromEnv:
+    def test_default_batch_size_without_env_variable(self, monkeypatch):
+        monkeypatch.delenv("ARGILLA_RECORDS_BATCH_SIZE", raising=False)
+
+        assert _default_batch_size_from_env() == RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK
+
+    def test_default_batch_size_with_custom_value(self, monkeypatch):
+        monkeypatch.setenv("ARGILLA_RECORDS_BATCH_SIZE", "100")
+
+        assert _default_batch_size_from_env() == 100
+
+    def test_default_batch_size_is_clamped_to_server_limit(self, monkeypatch):
+        monkeypatch.setenv("ARGILLA_RECORDS_BATCH_SIZE", "99999")
+
+        assert _default_batch_size_from_env() == RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK
+
+    def test_default_batch_size_is_clamped_to_a_minimum_of_one(self, monkeypatch):
+        monkeypatch.setenv("ARGILLA_RECORDS_BATCH_SIZE", "0")
+
+        assert _default_batch_size_from_env() == 1
+
+    def test_default_batch_size_with_invalid_value(self, monkeypatch):
+        monkeypatch.setenv("ARGILLA_RECORDS_BATCH_SIZE", "abc")
+
+        with pytest.warns(UserWarning, match="Ignoring invalid ARGILLA_RECORDS_BATCH_SIZE value 'abc'"):
+            assert _default_batch_size_from_env() == RecordsAPI.MAX_RECORDS_PER_UPSERT_BULK